@@ -72,7 +72,7 @@ CALIBRATION: If both solutions use the same core algorithm and produce equivalen
 }'
 
 # Extract .py code files from workspace, stripping comments and blank lines.
-# Uses Python's tokenizer to correctly distinguish comments from # in strings.
+# A single-pass scanner skips string literals, so # inside strings is kept.
 extract_code() {
     local workspace="$1"
     local code=""
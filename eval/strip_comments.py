@@ -1,32 +1,173 @@
-"""Strip comments from Python source code using the tokenizer.
+"""Strip comments from Python source code with a single-pass scanner.
 
 Reads from stdin, writes comment-free code to stdout.
-Falls back to passthrough on parse errors (e.g. non-Python content).
+Falls back to passthrough on unparseable input (an unterminated
+triple-quoted string or f-string, unbalanced brackets, or a dangling line
+continuation).
+
+F-strings follow Python 3.12+ (PEP 701) rules: a replacement field may reuse
+the string's own quote and, in a triple-quoted f-string, hold comments.
 """
 
-import io
+import re
 import sys
-import tokenize
+
+# Characters that can change scanner state outside of a string.
+_SPECIAL_RE = re.compile(r"[#'\"()\[\]{}\\]")
+# Inside an f-string replacement field, where a top-level ':' starts the format spec.
+_FIELD_SPECIAL_RE = re.compile(r"[#'\"()\[\]{}\\:]")
+# Inside the literal text or format spec of an f-string.
+_FSTRING_SPECIAL_RE = re.compile(r"[{}\\'\"\n]")
+
+# String literals, keyed by opening quote (same shapes as the tokenize
+# module's patterns). Prefixes (r, b, f, ...) need no special handling: even
+# in raw strings a backslash keeps the following quote from closing it.
+_STRING_RES = {
+    "'''": re.compile(r"'''[^'\\]*(?:(?:\\.|'(?!''))[^'\\]*)*'''", re.DOTALL),
+    '"""': re.compile(r'"""[^"\\]*(?:(?:\\.|"(?!""))[^"\\]*)*"""', re.DOTALL),
+    "'": re.compile(r"'[^\n'\\]*(?:\\.[^\n'\\]*)*'", re.DOTALL),
+    '"': re.compile(r'"[^\n"\\]*(?:\\.[^\n"\\]*)*"', re.DOTALL),
+}
+
+# A line holding nothing but whitespace (the last line may lack its newline).
+_BLANK_LINE_RE = re.compile(r"^[^\S\n]*(?:\n|\Z)", re.MULTILINE)
+
+# Scanner states kept on the f-string stack, innermost last
+_FSTRING = 0  # literal text of an f-string
+_FIELD = 1  # expression inside a {replacement field}
+_SPEC = 2  # format spec after a field's top-level ':'
+
+
+def _string_prefix(source: str, i: int) -> str:
+    """Return the lowercased identifier characters directly before source[i]."""
+    j = i
+    while j > 0 and (source[j - 1].isalnum() or source[j - 1] == "_"):
+        j -= 1
+    return source[j:i].lower()
 
 
 def strip_comments(source: str) -> str:
-    lines = source.splitlines(True)
-    # Collect (line_index, col) for each comment token
-    comment_positions: list[tuple[int, int]] = []
-    try:
-        for tok in tokenize.generate_tokens(io.StringIO(source).readline):
-            if tok.type == tokenize.COMMENT:
-                comment_positions.append((tok.start[0] - 1, tok.start[1]))
-    except tokenize.TokenError:
-        return source  # unparseable — return unchanged
-
-    # Truncate each line at the comment start
-    for line_idx, col in reversed(comment_positions):
-        if line_idx < len(lines):
-            lines[line_idx] = lines[line_idx][:col].rstrip() + "\n"
-
-    # Drop blank lines
-    return "".join(line for line in lines if line.strip())
+    out: list[str] = []
+    depth = 0  # bracket nesting of the code being scanned
+    # Open f-strings and their fields: (state, quote, raw, saved depth)
+    stack: list[tuple[int, str, bool, int]] = []
+    run_start = 0  # start of code not yet copied to out
+    pos = 0
+    n = len(source)
+
+    while True:
+        state = stack[-1][0] if stack else None
+
+        if state == _FSTRING or state == _SPEC:
+            _, quote, raw, saved_depth = stack[-1]
+            match = _FSTRING_SPECIAL_RE.search(source, pos)
+            if match is None:
+                return source  # unterminated f-string
+            i = match.start()
+            c = source[i]
+            if c == "{":
+                if state == _FSTRING and source.startswith("{", i + 1):
+                    pos = i + 2  # literal '{{'
+                else:
+                    stack.append((_FIELD, quote, raw, depth))
+                    depth = 0
+                    pos = i + 1
+            elif c == "}":
+                if state == _SPEC:
+                    stack.pop()  # closes the field the spec belongs to
+                    depth = saved_depth
+                    pos = i + 1
+                elif source.startswith("}", i + 1):
+                    pos = i + 2  # literal '}}'
+                else:
+                    return source  # single '}' in f-string
+            elif c == "\\":
+                pos = i + 1
+                if not raw and source.startswith("N{", pos):
+                    end = source.find("}", pos)  # \N{NAME} escape, not a field
+                    if end < 0:
+                        return source
+                    pos = end + 1
+                elif pos < n and source[pos] not in "{}":
+                    pos += 1
+            elif c == "\n":
+                if len(quote) == 1:
+                    return source  # unterminated single-quoted f-string
+                pos = i + 1
+            elif source.startswith(quote, i):
+                if state == _SPEC:
+                    return source  # string closed inside a replacement field
+                stack.pop()
+                depth = saved_depth
+                pos = i + len(quote)
+            else:
+                pos = i + 1
+            continue
+
+        match = (_FIELD_SPECIAL_RE if stack else _SPECIAL_RE).search(source, pos)
+        if match is None:
+            break
+        i = match.start()
+        c = source[i]
+
+        if c == "#":
+            # Truncate the line at the comment, dropping whitespace before it;
+            # the newline stays in the next run
+            k = i
+            while k > run_start and source[k - 1] != "\n" and source[k - 1].isspace():
+                k -= 1
+            out.append(source[run_start:k])
+            end = source.find("\n", i)
+            if end < 0:
+                out.append("\n")
+                run_start = n
+                break
+            run_start = pos = end
+        elif c == "'" or c == '"':
+            quote = c * 3 if source.startswith(c * 3, i) else c
+            string = _STRING_RES[quote].match(source, i)
+            if _string_prefix(source, i) in ("f", "rf", "fr") and (
+                string is None or "{" in string[0] or "}" in string[0]
+            ):
+                # An f-string with braces: scan its literal text and fields
+                stack.append((_FSTRING, quote, "r" in _string_prefix(source, i), depth))
+                pos = i + len(quote)
+            elif string is not None:
+                pos = string.end()
+            elif len(quote) == 3:
+                return source  # unterminated triple-quoted string
+            else:
+                pos = i + 1  # stray quote — scan on, as tokenize does
+        elif c == "\\":
+            pos = i + 1
+            if source.startswith("\r\n", pos):
+                pos += 2
+            elif source.startswith("\n", pos):
+                pos += 1
+            if pos >= n:
+                return source  # line continuation into EOF
+        elif c in "([{":
+            depth += 1
+            pos = i + 1
+        elif stack and depth == 0 and (c == "}" or c == ":"):
+            _, quote, raw, saved_depth = stack.pop()
+            if c == ":":
+                stack.append((_SPEC, quote, raw, saved_depth))
+            else:
+                depth = saved_depth
+            pos = i + 1
+        elif c == ":":
+            pos = i + 1
+        else:
+            depth -= 1
+            pos = i + 1
+
+    if depth or stack:
+        return source  # unbalanced brackets or an unterminated f-string
+    out.append(source[run_start:])
+
+    # Drop blank lines in one pass over the joined output
+    return _BLANK_LINE_RE.sub("", "".join(out))
 
 
 if __name__ == "__main__":
@@ -1,119 +1,267 @@
 """Split WikiExtractor output into one text file per article.
 
 Supports both JSON format (--json flag, one JSON object per line) and
-legacy XML format (<doc>...</doc> blocks). JSON is preferred — it streams
-line-by-line with constant memory.
+legacy XML format (<doc>...</doc> blocks). JSON is streamed line-by-line
+and XML is scanned through an mmap, so memory stays bounded by the largest
+single article.
+
+--jsonl-shards writes one JSONL file per 2-char slug prefix instead of one
+file per article; the default layout is what setup/build-index.sh and the
+wiki-lookup skill search with find/rg.
 """
 
 import argparse
+import functools
+import itertools
 import json
+import mmap
+import multiprocessing
 import os
 import re
 import sys
+from collections.abc import Iterator
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+DOC_START = b'<doc id="'
+DOC_START_RE = re.compile(rb'<doc id="(\d+)" url="([^"]*)" title="([^"]*)">\n')
+DOC_END = b'</doc>'
+MIN_BODY_CHARS = 50  # shorter (stripped) bodies are stubs and are skipped
+
+
+class _SlugTable(dict):
+    """str.translate table: drop non-word chars, map whitespace/underscore to '_'.
+
+    Entries are filled lazily on first lookup, so the table only ever holds
+    characters that actually occur in titles.
+    """
+
+    def __missing__(self, codepoint: int) -> int | None:
+        c = chr(codepoint)
+        if c.isspace() or c == '_':
+            value = ord('_')
+        elif c.isalnum() or c == '-':
+            value = codepoint
+        else:
+            value = None
+        self[codepoint] = value
+        return value
+
+
+_SLUG_TABLE = _SlugTable()
 
 
 def slugify(title: str) -> str:
     """Convert article title to safe filename."""
-    slug = title.strip().lower()
-    slug = re.sub(r'[^\w\s-]', '', slug)
-    slug = re.sub(r'[\s_]+', '_', slug)
-    slug = slug.strip('_')
-    return slug[:200]
+    # Whitespace becomes '_' in the table, so strip('_') also covers strip()
+    slug = title.lower().translate(_SLUG_TABLE)
+    while '__' in slug:
+        slug = slug.replace('__', '_')
+    return slug.strip('_')[:200]
 
 
-def write_article(articles_dir: str, title: str, body: str) -> bool:
-    """Write a single article to disk. Returns True if written."""
-    body = body.strip()
-    if not body or len(body) < 50:
-        return False
+def write_article(
+    articles_dir: str,
+    title: str,
+    body: str,
+    created_dirs: set[str],
+    shard_lines: dict[str, list[str]] | None = None,
+) -> bool:
+    """Write a single article to disk. Returns True if written.
 
+    body must already be stripped and at least MIN_BODY_CHARS long — callers
+    filter stubs before getting here. created_dirs remembers which output
+    subdirectories already exist, so makedirs runs once per prefix rather
+    than once per article. If shard_lines is given, the article is instead
+    queued there as a JSON line for its prefix's shard; the caller appends
+    the lines to the shard files.
+    """
     slug = slugify(title)
     if not slug:
         return False
 
     subdir = slug[:2] if len(slug) >= 2 else slug
+
+    if shard_lines is not None:
+        line = json.dumps({"slug": slug, "title": title, "body": body}, ensure_ascii=False)
+        shard_lines.setdefault(subdir, []).append(line + "\n")
+        return True
+
     outdir = os.path.join(articles_dir, subdir)
-    os.makedirs(outdir, exist_ok=True)
+    if outdir not in created_dirs:
+        os.makedirs(outdir, exist_ok=True)
+        created_dirs.add(outdir)
 
     outpath = os.path.join(outdir, f"{slug}.txt")
-    with open(outpath, 'w', encoding='utf-8') as out:
-        out.write(f"# {title}\n\n")
-        out.write(body)
-        out.write("\n")
+    with open(outpath, 'w', buffering=1 << 16, encoding='utf-8') as out:
+        out.write(f"# {title}\n\n{body}\n")
     return True
 
 
 def is_json_format(filepath: str) -> bool:
-    """Check if a wiki_ file uses JSON format (first line is valid JSON)."""
-    with open(filepath, 'r', encoding='utf-8') as f:
-        first_line = f.readline().strip()
-        if not first_line:
-            return False
-        try:
-            json.loads(first_line)
-            return True
-        except (json.JSONDecodeError, ValueError):
-            return False
-
-
-def split_json(filepath: str, articles_dir: str) -> int:
-    """Stream JSON file line-by-line — constant memory."""
+    """Check if a wiki_ file uses JSON format (first non-blank byte is '{')."""
+    with open(filepath, 'rb') as f:
+        head = f.read(4096).lstrip()
+    return head[:1] == b'{'
+
+
+def split_json(
+    filepath: str,
+    articles_dir: str,
+    created_dirs: set[str] | None = None,
+    shard_lines: dict[str, list[str]] | None = None,
+) -> int:
+    """Stream JSON file line-by-line — constant memory.
+
+    Lines are parsed as raw bytes, with orjson when it is installed.
+    """
+    if created_dirs is None:
+        created_dirs = set()
     count = 0
-    with open(filepath, 'r', encoding='utf-8') as f:
+    with open(filepath, 'rb') as f:
         for line in f:
             line = line.strip()
             if not line:
                 continue
             try:
-                doc = json.loads(line)
-            except (json.JSONDecodeError, ValueError):
+                doc = json_loads(line)
+            except (json.JSONDecodeError, ValueError):  # orjson's error subclasses both
+                continue
+            body = doc.get("text", "").strip()
+            if len(body) < MIN_BODY_CHARS:
                 continue
             title = doc.get("title", "")
-            body = doc.get("text", "")
-            if write_article(articles_dir, title, body):
+            if write_article(articles_dir, title, body, created_dirs, shard_lines):
                 count += 1
     return count
 
 
-def split_xml(filepath: str, articles_dir: str) -> int:
-    """Legacy XML format — reads full file into memory."""
+def split_xml(
+    filepath: str,
+    articles_dir: str,
+    created_dirs: set[str] | None = None,
+    shard_lines: dict[str, list[str]] | None = None,
+) -> int:
+    """Legacy XML format — scans <doc> blocks in the memory-mapped file.
+
+    WikiExtractor does not escape document bodies, so the file is not
+    well-formed XML; blocks are delimited by their header and </doc> instead.
+    Matching runs on the raw bytes of an mmap, so only titles and bodies are
+    ever decoded.
+    """
+    if created_dirs is None:
+        created_dirs = set()
     count = 0
-    with open(filepath, 'r', encoding='utf-8') as f:
-        content = f.read()
-
-    for match in re.finditer(
-        r'<doc id="(\d+)" url="([^"]*)" title="([^"]*)">\n(.*?)</doc>',
-        content, re.DOTALL,
-    ):
-        _doc_id, _url, title, body = match.groups()
-        if write_article(articles_dir, title, body):
-            count += 1
+    with open(filepath, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return 0
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            pos = 0
+            while True:
+                # Locate candidates with a literal find and only run the
+                # regex over one header line, so matching stays linear
+                start = mm.find(DOC_START, pos)
+                if start < 0:
+                    break
+                line_end = mm.find(b'\n', start)
+                if line_end < 0:
+                    break
+                match = DOC_START_RE.match(mm, start, line_end + 1)
+                if match is None:
+                    pos = start + 1
+                    continue
+                end = mm.find(DOC_END, match.end())
+                if end < 0:
+                    break
+                pos = end + len(DOC_END)
+                # A UTF-8 body has at least as many bytes as chars, so short
+                # stubs are rejected before decoding anything
+                if end - match.end() < MIN_BODY_CHARS:
+                    continue
+                body = mm[match.end():end].decode('utf-8').strip()
+                if len(body) < MIN_BODY_CHARS:
+                    continue
+                title = match.group(3).decode('utf-8')
+                if write_article(articles_dir, title, body, created_dirs, shard_lines):
+                    count += 1
     return count
 
 
-def split(extracted_dir: str, articles_dir: str) -> None:
-    """Walk extracted wiki files and write one .txt per article."""
+def iter_wiki_files(extracted_dir: str) -> Iterator[str]:
+    """Yield the paths of all wiki_* files under extracted_dir, unsorted.
+
+    Order does not matter for splitting, so entries are streamed straight
+    from scandir (like os.walk, symlinked directories are not followed).
+    """
+    with os.scandir(extracted_dir) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                if not entry.is_symlink():
+                    yield from iter_wiki_files(entry.path)
+            elif entry.name.startswith("wiki_"):
+                yield entry.path
+
+
+# Output directories already created by this process (one set per pool worker).
+_created_dirs: set[str] = set()
+
+
+def _split_file(filepath: str, articles_dir: str, fmt: str, jsonl_shards: bool) -> tuple[int, dict[str, str]]:
+    """Pool worker: split one wiki_ file.
+
+    Returns the article count and, in shard mode, the JSONL text to append per
+    prefix — shards are written by the parent so appends never interleave.
+    """
+    shard_lines: dict[str, list[str]] | None = {} if jsonl_shards else None
+    splitter = split_json if fmt == "json" else split_xml
+    count = splitter(filepath, articles_dir, _created_dirs, shard_lines)
+    return count, {prefix: "".join(lines) for prefix, lines in (shard_lines or {}).items()}
+
+
+def split(extracted_dir: str, articles_dir: str, jsonl_shards: bool = False, jobs: int | None = None) -> None:
+    """Walk extracted wiki files and write one .txt per article.
+
+    With jsonl_shards, articles are instead appended to one JSONL file per
+    2-char slug prefix ({articles_dir}/{prefix}.jsonl). Files are split in
+    parallel across jobs worker processes (default: one per CPU).
+    """
+    filepaths = iter_wiki_files(extracted_dir)
+    first = next(filepaths, None)
     count = 0
-    detected_format = None
+    if first is None:
+        print(f"      Done. {count:,} articles written to {articles_dir}", file=sys.stderr)
+        return
 
-    for root, _dirs, files in os.walk(extracted_dir):
-        for fname in sorted(files):
-            if not fname.startswith("wiki_"):
-                continue
-            filepath = os.path.join(root, fname)
+    # Auto-detect format from first file
+    detected_format = "json" if is_json_format(first) else "xml"
+    print(f"      Detected {detected_format} format", file=sys.stderr)
 
-            # Auto-detect format from first file
-            if detected_format is None:
-                detected_format = "json" if is_json_format(filepath) else "xml"
-                print(f"      Detected {detected_format} format", file=sys.stderr)
+    if jsonl_shards:
+        os.makedirs(articles_dir, exist_ok=True)
+    worker = functools.partial(
+        _split_file, articles_dir=articles_dir, fmt=detected_format, jsonl_shards=jsonl_shards,
+    )
+    jobs = jobs or os.cpu_count() or 1
+    next_report = 100_000
 
-            if detected_format == "json":
-                count += split_json(filepath, articles_dir)
-            else:
-                count += split_xml(filepath, articles_dir)
+    with multiprocessing.Pool(jobs) as pool:
+        for file_count, shard_text in pool.imap_unordered(
+            worker, itertools.chain((first,), filepaths), chunksize=8,
+        ):
+            # One append per prefix per input file; shards are not held open,
+            # since there can be far more prefixes than file descriptors
+            for prefix, text in shard_text.items():
+                shard_path = os.path.join(articles_dir, f"{prefix}.jsonl")
+                with open(shard_path, 'a', encoding='utf-8') as shard:
+                    shard.write(text)
 
-            if count % 100_000 == 0 and count > 0:
+            count += file_count
+            if count >= next_report:
                 print(f"      {count:,} articles written...", file=sys.stderr)
+                next_report = (count // 100_000 + 1) * 100_000
 
     print(f"      Done. {count:,} articles written to {articles_dir}", file=sys.stderr)
 
@@ -130,8 +278,20 @@ def main() -> None:
         "articles_dir",
         help="Output directory for individual article .txt files",
     )
+    parser.add_argument(
+        "--jsonl-shards",
+        action="store_true",
+        help="Append articles to one JSONL shard per 2-char slug prefix instead of "
+        "writing one .txt file per article",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Worker processes to split files with (default: number of CPUs)",
+    )
     args = parser.parse_args()
-    split(args.extracted_dir, args.articles_dir)
+    split(args.extracted_dir, args.articles_dir, jsonl_shards=args.jsonl_shards, jobs=args.jobs)
 
 
 if __name__ == "__main__":
@@ -13,15 +13,23 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import functools
 import importlib
+import itertools
 import json
+import math
 import random
-import statistics
 import sys
 import traceback
+from collections.abc import Callable, Iterator
 from dataclasses import dataclass, field
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 # ---------------------------------------------------------------------------
 # Simulated Backend (implements BackendHandle protocol, invisible to agent)
@@ -39,6 +47,9 @@ class SimulatedBackend:
         self._name = name
         self._base_latency_ms = base_latency_ms
         self._rng = rng or random.Random()
+        # Bound once; uniform(-0.1, 0.1) is inlined below as 0.2 * r - 0.1,
+        # which is bit-identical and skips a Python-level call per draw
+        self._random = self._rng.random
         self._alive = True
         self._latency_multiplier = 1.0
         self._error_rate = 0.0
@@ -52,8 +63,8 @@ class SimulatedBackend:
             return (False, 0.0)
         latency = self._base_latency_ms * self._latency_multiplier
         # Add jitter (±10%)
-        latency *= 1.0 + self._rng.uniform(-0.1, 0.1)
-        if self._rng.random() < self._error_rate:
+        latency *= 1.0 + (0.2 * self._random() - 0.1)
+        if self._random() < self._error_rate:
             return (False, latency)
         return (True, latency)
 
@@ -61,7 +72,7 @@ class SimulatedBackend:
         if not self._alive:
             return (False, 0.0)
         latency = self._base_latency_ms * self._latency_multiplier * 0.1
-        latency *= 1.0 + self._rng.uniform(-0.1, 0.1)
+        latency *= 1.0 + (0.2 * self._random() - 0.1)
         return (True, latency)
 
     # --- Fault injection (benchmark only, not on protocol) ---
@@ -88,7 +99,7 @@ class SimulatedBackend:
 # Scenario infrastructure
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class ScenarioResult:
     name: str
     score: float  # 0.0 – 1.0
@@ -97,48 +108,149 @@ class ScenarioResult:
     error: str | None = None
 
 
-def make_requests(tick: int, count: int, rng: random.Random, priority_weights: tuple[float, float, float] = (1, 1, 1)) -> list:
-    """Generate requests for a tick with given priority distribution."""
-    # Import here to use from the contract
+# Contract types, bound by _load_types() once the workspace is importable
+Priority = None
+Request = None
+PRIORITIES: tuple = ()
+
+
+def _load_types() -> None:
+    """Import Priority/Request from the workspace's contract module (once)."""
+    global Priority, Request, PRIORITIES
+    if Request is not None:
+        return
     from load_balancer.types import Priority, Request
 
-    priorities = [Priority.BACKGROUND, Priority.NORMAL, Priority.CRITICAL]
-    weights = list(priority_weights)
-    requests = []
-    for i in range(count):
-        p = rng.choices(priorities, weights=weights, k=1)[0]
-        requests.append(Request(id=tick * 10000 + i, priority=p, tick=tick))
-    return requests
+    PRIORITIES = (Priority.BACKGROUND, Priority.NORMAL, Priority.CRITICAL)
+
+
+_EQUAL_WEIGHTS = (1, 1, 1)
+
+
+@functools.lru_cache(maxsize=None)
+def _cum_weights(priority_weights: tuple[float, float, float]) -> tuple[float, ...]:
+    return tuple(itertools.accumulate(priority_weights))
+
+
+def make_requests(tick: int, count: int, rng: random.Random, priority_weights: tuple[float, float, float] = _EQUAL_WEIGHTS) -> list:
+    """Generate requests for a tick with given priority distribution."""
+    # One draw for the whole tick; consumes the same random() stream as
+    # drawing each request's priority separately
+    if priority_weights == _EQUAL_WEIGHTS:
+        # Unweighted choices picks floor(random() * 3), the same index that
+        # bisecting cumulative weights (1, 2, 3) yields
+        picks = rng.choices(PRIORITIES, k=count)
+    else:
+        picks = rng.choices(PRIORITIES, cum_weights=_cum_weights(priority_weights), k=count)
+    # map() calls Request positionally (id, priority, tick, in contract field
+    # order), skipping the comprehension's per-item keyword packing
+    base_id = tick * 10000
+    return list(map(Request, range(base_id, base_id + count), picks, itertools.repeat(tick, count)))
+
+
+def make_backends(seed: int, count: int, base_latency_ms: float = 50.0) -> list[SimulatedBackend]:
+    """
+    Identical backends B0..B{count-1}; backend i draws from Random(seed + i).
+
+    Each backend keeps its own stream so its jitter/errors depend only on the
+    traffic it receives, not on how the LB spreads requests across the others.
+    """
+    return [SimulatedBackend(f"B{i}", base_latency_ms=base_latency_ms, rng=random.Random(seed + i)) for i in range(count)]
+
+
+def simulate(
+    lb,
+    rng: random.Random,
+    n_ticks: int,
+    count: int,
+    faults: dict[int, tuple[Callable[[], None], ...]] | None = None,
+) -> Iterator[tuple[int, list, list]]:
+    """
+    Drive a scenario's tick loop, yielding (tick, requests, responses).
+
+    faults maps a tick to the fault-injection calls to make, in order, at the
+    start of that tick before its requests are generated.
+    """
+    faults = faults or {}
+    for tick in range(n_ticks):
+        for inject in faults.get(tick, ()):
+            inject()
+        reqs = make_requests(tick, count, rng)
+        yield tick, reqs, run_tick(lb, tick, reqs)
 
 
 def run_tick(lb, tick: int, requests: list) -> list:
     """Run one simulation tick: call tick(), then handle each request."""
     lb.tick()
-    responses = []
-    for req in requests:
-        resp = lb.handle_request(req)
-        responses.append(resp)
-    return responses
+    # handle_request is looked up once per tick rather than once per request
+    return list(map(lb.handle_request, requests))
 
 
 # ---------------------------------------------------------------------------
 # Scoring helpers
 # ---------------------------------------------------------------------------
 
+def backend_index(backends: list) -> dict[str, int]:
+    """Map each backend name to its position, for tally_responses()."""
+    return {b.name: i for i, b in enumerate(backends)}
+
+
+def tally_responses(resps: list, name_to_idx: dict[str, int]) -> tuple[list[int], list[int], list[int]]:
+    """
+    Count one tick's responses per backend in a single pass.
+
+    Returns (admitted, success, failed) lists indexed by name_to_idx, where
+    failed counts admitted responses that did not succeed. The extra last
+    slot collects responses that name no known backend (e.g. shed ones), so
+    sum(admitted) is the tick's total admitted count.
+    """
+    other = len(name_to_idx)
+    admitted = [0] * (other + 1)
+    success = [0] * (other + 1)
+    failed = [0] * (other + 1)
+    for r in resps:
+        i = name_to_idx.get(r.backend_name, other)
+        if r.admitted:
+            admitted[i] += 1
+            if not r.success:
+                failed[i] += 1
+        if r.success:
+            success[i] += 1
+    return admitted, success, failed
+
+
 def coefficient_of_variation(values: list) -> float:
     """CV = stddev / mean. Lower = more even distribution."""
-    if not values or all(v == 0 for v in values):
+    n = len(values)
+    if n < 2:
         return 0.0
-    mean = statistics.mean(values)
-    if mean == 0:
+    # One pass over sums; exact for the integer counts this is called with
+    total = 0
+    total_sq = 0
+    for v in values:
+        total += v
+        total_sq += v * v
+    if total == 0:
         return 0.0
-    return statistics.stdev(values) / mean if len(values) > 1 else 0.0
+    variance = (n * total_sq - total * total) / (n * (n - 1))
+    return math.sqrt(max(variance, 0.0)) / (total / n)
 
 
 def clamp(value: float, lo: float = 0.0, hi: float = 1.0) -> float:
     return max(lo, min(hi, value))
 
 
+def _fast_mean(values: list) -> float:
+    """Mean of a non-empty list, without statistics' exact-fraction arithmetic."""
+    return math.fsum(values) / len(values)
+
+
+def _fast_stdev(values: list) -> float:
+    """Sample standard deviation of a list of at least two values (two-pass)."""
+    mean = math.fsum(values) / len(values)
+    return math.sqrt(math.fsum((v - mean) * (v - mean) for v in values) / (len(values) - 1))
+
+
 # ---------------------------------------------------------------------------
 # Scenario 1: Steady State
 # ---------------------------------------------------------------------------
@@ -146,28 +258,26 @@ def clamp(value: float, lo: float = 0.0, hi: float = 1.0) -> float:
 def scenario_steady_state(lb_class, seed: int) -> ScenarioResult:
     """3 healthy backends, 30 req/tick, 50 ticks. Measures baseline routing quality."""
     rng = random.Random(seed)
-    backends = [SimulatedBackend(f"B{i}", base_latency_ms=50.0, rng=random.Random(seed + i)) for i in range(3)]
+    backends = make_backends(seed, 3)
     lb = lb_class(backends)
+    name_to_idx = backend_index(backends)
 
-    backend_counts: dict[str, int] = {b.name: 0 for b in backends}
+    counts = [0] * len(backends)
     total_admitted = 0
     total_success = 0
     total_requests = 0
 
-    for tick in range(50):
-        reqs = make_requests(tick, 30, rng)
+    for _, reqs, resps in simulate(lb, rng, 50, 30):
         total_requests += len(reqs)
-        resps = run_tick(lb, tick, reqs)
-        for r in resps:
-            if r.admitted:
-                total_admitted += 1
-                if r.backend_name in backend_counts:
-                    backend_counts[r.backend_name] += 1
-                if r.success:
-                    total_success += 1
+        admitted, _, failed = tally_responses(resps, name_to_idx)
+        tick_admitted = sum(admitted)
+        total_admitted += tick_admitted
+        total_success += tick_admitted - sum(failed)
+        for i in range(len(counts)):
+            counts[i] += admitted[i]
 
     # Score: evenness of distribution + high admission rate
-    counts = list(backend_counts.values())
+    backend_counts: dict[str, int] = {b.name: counts[i] for i, b in enumerate(backends)}
     cv = coefficient_of_variation(counts)
     admission_rate = total_admitted / total_requests if total_requests else 0
     success_rate = total_success / total_admitted if total_admitted else 0
@@ -203,39 +313,34 @@ def scenario_degradation_detection(lb_class, seed: int) -> ScenarioResult:
     Measures detection speed — how fast traffic shifts away from A.
     """
     rng = random.Random(seed)
-    backends = [SimulatedBackend(f"B{i}", base_latency_ms=50.0, rng=random.Random(seed + i)) for i in range(3)]
+    backends = make_backends(seed, 3)
     lb = lb_class(backends)
+    name_to_idx = backend_index(backends)
 
-    detection_tick = None
+    b0_shares: list[float | None] = []  # per tick 10-60; None if nothing admitted
     error_count_during_detection = 0
     total_during_detection = 0
 
-    for tick in range(80):
-        # Fault injection
-        if tick == 10:
-            backends[0].degrade(latency_multiplier=6.0, error_rate=0.3)
-        if tick == 60:
-            backends[0].revive()
-
-        reqs = make_requests(tick, 30, rng)
-        resps = run_tick(lb, tick, reqs)
+    faults = {
+        10: (functools.partial(backends[0].degrade, latency_multiplier=6.0, error_rate=0.3),),
+        60: (backends[0].revive,),
+    }
 
+    for tick, reqs, resps in simulate(lb, rng, 80, 30, faults):
         # Track B0's traffic share after degradation
         if 10 <= tick <= 60:
-            b0_count = sum(1 for r in resps if r.backend_name == backends[0].name and r.admitted)
-            total_count = sum(1 for r in resps if r.admitted)
+            admitted, _, failed = tally_responses(resps, name_to_idx)
+            total_count = sum(admitted)
             total_during_detection += total_count
+            b0_shares.append(admitted[0] / total_count if total_count else None)
 
             # Count errors routed to B0
-            error_count_during_detection += sum(
-                1 for r in resps if r.backend_name == backends[0].name and r.admitted and not r.success
-            )
+            error_count_during_detection += failed[0]
 
-            # Detection = B0 gets < 20% of traffic
-            if detection_tick is None and total_count > 0:
-                share = b0_count / total_count
-                if share < 0.20:
-                    detection_tick = tick
+    # Detection = first tick B0 gets < 20% of traffic
+    detection_tick = next(
+        (10 + i for i, share in enumerate(b0_shares) if share is not None and share < 0.20), None
+    )
 
     # Score: faster detection = better
     if detection_tick is None:
@@ -275,41 +380,35 @@ def scenario_priority_protection(lb_class, seed: int) -> ScenarioResult:
     Tick 10: A killed. Tick 30: B degraded. Tick 60: B killed. Tick 80: both revive.
     Measures: critical success rate + correct priority ordering of shed rates.
     """
-    from load_balancer.types import Priority
-
     rng = random.Random(seed)
-    backends = [SimulatedBackend(f"B{i}", base_latency_ms=50.0, rng=random.Random(seed + i)) for i in range(3)]
+    backends = make_backends(seed, 3)
     lb = lb_class(backends)
 
-    # Track per-priority outcomes during stress (ticks 10-80)
+    # Track per-priority outcomes during stress (ticks 10-80). IntEnum keys use
+    # int's C-level __hash__, so these dicts are as cheap to bump as lists
     priority_admitted: dict[int, int] = {p: 0 for p in Priority}
     priority_total: dict[int, int] = {p: 0 for p in Priority}
     priority_success: dict[int, int] = {p: 0 for p in Priority}
     zero_throughput_ticks = 0
 
-    for tick in range(100):
-        if tick == 10:
-            backends[0].kill()
-        if tick == 30:
-            backends[1].degrade(latency_multiplier=4.0, error_rate=0.25)
-        if tick == 60:
-            backends[1].kill()
-        if tick == 80:
-            backends[0].revive()
-            backends[1].revive()
-
-        reqs = make_requests(tick, 40, rng)
-        resps = run_tick(lb, tick, reqs)
+    faults = {
+        10: (backends[0].kill,),
+        30: (functools.partial(backends[1].degrade, latency_multiplier=4.0, error_rate=0.25),),
+        60: (backends[1].kill,),
+        80: (backends[0].revive, backends[1].revive),
+    }
 
+    for tick, reqs, resps in simulate(lb, rng, 100, 40, faults):
         if 10 <= tick < 80:
             tick_admitted = 0
             for req, resp in zip(reqs, resps):
-                priority_total[req.priority] += 1
+                p = req.priority
+                priority_total[p] += 1
                 if resp.admitted:
-                    priority_admitted[req.priority] += 1
+                    priority_admitted[p] += 1
                     tick_admitted += 1
                     if resp.success:
-                        priority_success[req.priority] += 1
+                        priority_success[p] += 1
             if tick_admitted == 0:
                 zero_throughput_ticks += 1
 
@@ -380,7 +479,7 @@ def scenario_recovery_smoothness(lb_class, seed: int) -> ScenarioResult:
     Measures: monotonic ramp-up + no overshoot + shed decreasing during recovery.
     """
     rng = random.Random(seed)
-    backends = [SimulatedBackend(f"B{i}", base_latency_ms=50.0, rng=random.Random(seed + i)) for i in range(3)]
+    backends = make_backends(seed, 3)
     lb = lb_class(backends)
 
     # Track success rate (not just admission) per tick during recovery
@@ -388,59 +487,64 @@ def scenario_recovery_smoothness(lb_class, seed: int) -> ScenarioResult:
     fault_success_rates: list[float] = []  # ticks 5-30 (during outage)
     shed_counts_recovery: list[int] = []
 
-    for tick in range(80):
-        if tick == 5:
-            backends[0].kill()
-            backends[1].kill()
-        if tick == 30:
-            backends[0].revive()
-        if tick == 50:
-            backends[1].revive()
+    faults = {
+        5: (backends[0].kill, backends[1].kill),
+        30: (backends[0].revive,),
+        50: (backends[1].revive,),
+    }
+
+    for tick, reqs, resps in simulate(lb, rng, 80, 30, faults):
+        if not 5 <= tick < 70:
+            continue
 
-        reqs = make_requests(tick, 30, rng)
-        resps = run_tick(lb, tick, reqs)
+        # One pass for both windows' counters
+        success = 0
+        shed = 0
+        for r in resps:
+            if r.success:
+                success += 1
+            if r.shed or not r.admitted:
+                shed += 1
+        rate = success / len(resps) if resps else 0
 
-        if 5 <= tick < 30:
+        if tick < 30:
             # During outage: measure success rate (naive will be low here)
-            success = sum(1 for r in resps if r.success)
-            rate = success / len(resps) if resps else 0
             fault_success_rates.append(rate)
-
-        if 30 <= tick < 70:
-            success = sum(1 for r in resps if r.success)
-            shed = sum(1 for r in resps if r.shed or not r.admitted)
-            rate = success / len(resps) if resps else 0
+        else:
             recovery_success_rates.append(rate)
             shed_counts_recovery.append(shed)
 
     # Monotonicity of success rate during recovery (smoothed over 3-tick windows)
     if len(recovery_success_rates) >= 3:
-        smoothed = []
-        for i in range(len(recovery_success_rates) - 2):
-            window = recovery_success_rates[i : i + 3]
-            smoothed.append(statistics.mean(window))
-
-        decreases = sum(1 for i in range(1, len(smoothed)) if smoothed[i] < smoothed[i - 1] - 0.05)
+        smoothed = [
+            math.fsum(recovery_success_rates[i : i + 3]) / 3
+            for i in range(len(recovery_success_rates) - 2)
+        ]
+
+        decreases = 0
+        for prev, cur in zip(smoothed, smoothed[1:]):
+            if cur < prev - 0.05:
+                decreases += 1
         monotonicity_score = clamp(1.0 - decreases / max(len(smoothed) - 1, 1))
     else:
         monotonicity_score = 0.5
 
     # Success rate during fault window: smart implementations shed to maintain
     # high success on what they do admit. Naive admits everything, gets ~33% success.
-    avg_fault_success = statistics.mean(fault_success_rates) if fault_success_rates else 0
+    avg_fault_success = _fast_mean(fault_success_rates) if fault_success_rates else 0
     fault_handling_score = clamp(avg_fault_success)
 
     # Shed should decrease during recovery
     if len(shed_counts_recovery) >= 4:
-        first_half = statistics.mean(shed_counts_recovery[: len(shed_counts_recovery) // 2])
-        second_half = statistics.mean(shed_counts_recovery[len(shed_counts_recovery) // 2 :])
+        first_half = _fast_mean(shed_counts_recovery[: len(shed_counts_recovery) // 2])
+        second_half = _fast_mean(shed_counts_recovery[len(shed_counts_recovery) // 2 :])
         shed_decreasing = second_half <= first_half + 1
         shed_score = 1.0 if shed_decreasing else 0.3
     else:
         shed_score = 0.5
 
     # Final success rate should be high (backends all healthy)
-    final_rate = statistics.mean(recovery_success_rates[-5:]) if len(recovery_success_rates) >= 5 else 0
+    final_rate = _fast_mean(recovery_success_rates[-5:]) if len(recovery_success_rates) >= 5 else 0
     final_score = clamp(final_rate)
 
     score = 0.3 * monotonicity_score + 0.25 * fault_handling_score + 0.2 * shed_score + 0.25 * final_score
@@ -470,49 +574,43 @@ def scenario_cascading_failure(lb_class, seed: int) -> ScenarioResult:
     Measures: cascade prevention + healthy backend protection.
     """
     rng = random.Random(seed)
-    backends = [SimulatedBackend(f"B{i}", base_latency_ms=50.0, rng=random.Random(seed + i)) for i in range(4)]
+    backends = make_backends(seed, 4)
     lb = lb_class(backends)
+    name_to_idx = backend_index(backends)
 
     # Track healthy backend (C, D) overload and overall throughput
     healthy_success: list[int] = []  # per-tick success on C+D during stress
     total_success_per_tick: list[int] = []
     b_traffic_after_degrade: list[int] = []
 
-    for tick in range(80):
-        if tick == 10:
-            backends[0].kill()
-        if tick == 25:
-            backends[1].degrade(latency_multiplier=3.0, error_rate=0.2)
-        if tick == 40:
-            backends[1].degrade(latency_multiplier=6.0, error_rate=0.5)
-        if tick == 60:
-            backends[0].revive()
-            backends[1].revive()
-
-        reqs = make_requests(tick, 50, rng)
-        resps = run_tick(lb, tick, reqs)
+    faults = {
+        10: (backends[0].kill,),
+        25: (functools.partial(backends[1].degrade, latency_multiplier=3.0, error_rate=0.2),),
+        40: (functools.partial(backends[1].degrade, latency_multiplier=6.0, error_rate=0.5),),
+        60: (backends[0].revive, backends[1].revive),
+    }
 
+    for tick, reqs, resps in simulate(lb, rng, 80, 50, faults):
         if 10 <= tick < 60:
-            cd_success = sum(1 for r in resps if r.backend_name in ("B2", "B3") and r.success)
-            healthy_success.append(cd_success)
-            total_success_per_tick.append(sum(1 for r in resps if r.success))
+            admitted, success, _ = tally_responses(resps, name_to_idx)
+            healthy_success.append(success[2] + success[3])
+            total_success_per_tick.append(sum(success))
 
-        if 25 <= tick < 60:
-            b_count = sum(1 for r in resps if r.backend_name == "B1" and r.admitted)
-            b_traffic_after_degrade.append(b_count)
+            if tick >= 25:
+                b_traffic_after_degrade.append(admitted[1])
 
     # Healthy backend protection: C+D should maintain reasonable throughput
-    avg_healthy = statistics.mean(healthy_success) if healthy_success else 0
+    avg_healthy = _fast_mean(healthy_success) if healthy_success else 0
     # With 50 req/tick and 2 healthy backends at 50ms, they can handle ~25 each
     protection_score = clamp(avg_healthy / 20)  # 20+ success/tick on healthy = good
 
     # B traffic should reduce after degradation
-    avg_b_traffic = statistics.mean(b_traffic_after_degrade) if b_traffic_after_degrade else 0
+    avg_b_traffic = _fast_mean(b_traffic_after_degrade) if b_traffic_after_degrade else 0
     # 50 req / 4 backends = ~12.5 baseline. Should be much lower after degrade.
     cascade_prevention = clamp(1.0 - avg_b_traffic / 12.5)
 
     # Overall throughput preservation
-    avg_throughput = statistics.mean(total_success_per_tick) if total_success_per_tick else 0
+    avg_throughput = _fast_mean(total_success_per_tick) if total_success_per_tick else 0
     throughput_score = clamp(avg_throughput / 30)  # 30+ success/tick = good
 
     score = 0.4 * protection_score + 0.3 * cascade_prevention + 0.3 * throughput_score
@@ -540,11 +638,10 @@ def scenario_flapping(lb_class, seed: int) -> ScenarioResult:
     3 backends. Ticks 10-60: A alternates degraded/healthy every 3 ticks.
     Tick 61: A stabilizes. Measures: dampening + critical always admitted + convergence.
     """
-    from load_balancer.types import Priority
-
     rng = random.Random(seed)
-    backends = [SimulatedBackend(f"B{i}", base_latency_ms=50.0, rng=random.Random(seed + i)) for i in range(3)]
+    backends = make_backends(seed, 3)
     lb = lb_class(backends)
+    name_to_idx = backend_index(backends)
 
     a_shares: list[float] = []  # A's traffic share per tick during flapping
     critical_success = 0
@@ -552,31 +649,26 @@ def scenario_flapping(lb_class, seed: int) -> ScenarioResult:
     flap_errors = 0  # errors during flapping from routing to degraded A
     flap_total = 0
     post_flap_shares: list[float] = []  # A's share after flapping ends
+    critical = Priority.CRITICAL  # requests carry the enum members themselves
 
-    for tick in range(80):
-        # Flapping: A alternates every 3 ticks between degraded and healthy
-        if 10 <= tick <= 60:
-            cycle = (tick - 10) // 3
-            if cycle % 2 == 0:
-                backends[0].degrade(latency_multiplier=5.0, error_rate=0.3)
-            else:
-                backends[0].revive()
-        if tick == 61:
-            backends[0].revive()
-
-        reqs = make_requests(tick, 30, rng)
-        resps = run_tick(lb, tick, reqs)
+    # Flapping: ticks 10-60 alternate A between degraded and healthy every 3
+    # ticks (re-applied each tick); tick 61 stabilizes it
+    degrade_a = (functools.partial(backends[0].degrade, latency_multiplier=5.0, error_rate=0.3),)
+    revive_a = (backends[0].revive,)
+    faults = {tick: revive_a if (tick - 10) // 3 % 2 else degrade_a for tick in range(10, 61)}
+    faults[61] = revive_a
 
-        admitted = [r for r in resps if r.admitted]
-        a_count = sum(1 for r in admitted if r.backend_name == "B0")
-        share = a_count / len(admitted) if admitted else 0
+    for tick, reqs, resps in simulate(lb, rng, 80, 30, faults):
+        admitted, _, failed = tally_responses(resps, name_to_idx)
+        total_admitted = sum(admitted)
+        share = admitted[0] / total_admitted if total_admitted else 0
 
         if 10 <= tick <= 60:
             a_shares.append(share)
             flap_total += len(resps)
-            flap_errors += sum(1 for r in resps if r.admitted and not r.success)
+            flap_errors += sum(failed)
             for req, resp in zip(reqs, resps):
-                if req.priority == Priority.CRITICAL:
+                if req.priority is critical:
                     critical_total += 1
                     if resp.success:
                         critical_success += 1
@@ -587,7 +679,7 @@ def scenario_flapping(lb_class, seed: int) -> ScenarioResult:
     # Dampening: low variance of A's share = good (not oscillating wildly)
     share_std = 0.0
     if len(a_shares) >= 2:
-        share_std = statistics.stdev(a_shares)
+        share_std = _fast_stdev(a_shares)
         # Perfect dampening = std ~0. Wild oscillation = std ~0.3+
         dampening_score = clamp(1.0 - share_std / 0.3)
     else:
@@ -604,7 +696,7 @@ def scenario_flapping(lb_class, seed: int) -> ScenarioResult:
 
     # Post-flap convergence: A should return to ~33% share
     if post_flap_shares:
-        final_avg = statistics.mean(post_flap_shares[-5:]) if len(post_flap_shares) >= 5 else statistics.mean(post_flap_shares)
+        final_avg = _fast_mean(post_flap_shares[-5:]) if len(post_flap_shares) >= 5 else _fast_mean(post_flap_shares)
         convergence_score = clamp(1.0 - abs(final_avg - 0.333) * 3)
     else:
         convergence_score = 0.5
@@ -621,7 +713,7 @@ def scenario_flapping(lb_class, seed: int) -> ScenarioResult:
             "critical_success_rate": round(crit_rate, 4),
             "flap_error_rate": round(flap_error_rate, 4),
             "error_score": round(error_score, 4),
-            "post_flap_avg_share": round(statistics.mean(post_flap_shares) if post_flap_shares else 0, 4),
+            "post_flap_avg_share": round(_fast_mean(post_flap_shares) if post_flap_shares else 0, 4),
             "convergence_score": round(convergence_score, 4),
         },
     )
@@ -643,27 +735,28 @@ def scenario_asymmetric(lb_class, seed: int) -> ScenarioResult:
         SimulatedBackend("Slow", base_latency_ms=150.0, rng=random.Random(seed + 2)),
     ]
     lb = lb_class(backends)
+    name_to_idx = backend_index(backends)
 
-    backend_counts: dict[str, int] = {"Fast": 0, "Medium": 0, "Slow": 0}
+    other = len(backends)  # slot for admitted responses naming no known backend
+    counts = [0] * (other + 1)
     total_latency = 0.0
     total_admitted = 0
     total_shed = 0
     total_requests = 0
 
-    for tick in range(60):
-        reqs = make_requests(tick, 30, rng)
+    for _, reqs, resps in simulate(lb, rng, 60, 30):
         total_requests += len(reqs)
-        resps = run_tick(lb, tick, reqs)
 
         for r in resps:
             if r.admitted:
                 total_admitted += 1
                 total_latency += r.latency_ms
-                if r.backend_name in backend_counts:
-                    backend_counts[r.backend_name] += 1
+                counts[name_to_idx.get(r.backend_name, other)] += 1
             if r.shed or not r.admitted:
                 total_shed += 1
 
+    backend_counts: dict[str, int] = {b.name: counts[i] for i, b in enumerate(backends)}
+
     # Traffic ordering: Fast > Medium > Slow
     ordering_correct = backend_counts["Fast"] >= backend_counts["Medium"] >= backend_counts["Slow"]
 
@@ -708,6 +801,21 @@ def scenario_asymmetric(lb_class, seed: int) -> ScenarioResult:
 # Main: import implementation, run all scenarios, output JSON
 # ---------------------------------------------------------------------------
 
+def dumps_results(results: dict, pretty: bool = False) -> bytes:
+    """
+    Serialize a results dict as UTF-8 JSON, with orjson if installed.
+
+    Output is compact unless pretty is set (2-space indent); report.py and
+    run_benchmarks.sh parse it either way.
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+        return orjson.dumps(results, option=option)
+    if pretty:
+        return json.dumps(results, indent=2).encode()
+    return json.dumps(results, separators=(",", ":")).encode()
+
+
 ALL_SCENARIOS = [
     scenario_steady_state,
     scenario_degradation_detection,
@@ -719,19 +827,56 @@ ALL_SCENARIOS = [
 ]
 
 
-def run_all(lb_class, seed: int) -> dict:
-    results = []
-    for scenario_fn in ALL_SCENARIOS:
-        try:
-            result = scenario_fn(lb_class, seed)
-        except Exception as e:
-            result = ScenarioResult(
-                name=scenario_fn.__name__.replace("scenario_", ""),
-                score=0.0,
-                weight=1.0,
-                error=f"{type(e).__name__}: {e}\n{traceback.format_exc()}",
-            )
-        results.append(result)
+def run_scenario(scenario_fn, lb_class, seed: int) -> ScenarioResult:
+    """Run one scenario, turning any exception into a zero-score result."""
+    try:
+        return scenario_fn(lb_class, seed)
+    except Exception as e:
+        return ScenarioResult(
+            name=scenario_fn.__name__.replace("scenario_", ""),
+            score=0.0,
+            weight=1.0,
+            error=f"{type(e).__name__}: {e}\n{traceback.format_exc()}",
+        )
+
+
+def _init_worker(path: list[str]) -> None:
+    """Pool initializer: make the workspace importable in spawned workers."""
+    sys.path[:] = path
+    _load_types()
+
+
+def run_all(lb_class, seed: int, jobs: int = 1) -> dict:
+    """
+    Run every scenario and aggregate the weighted score.
+
+    By default scenarios run in-process, one after another. With jobs > 1
+    they run across up to jobs worker processes, each scenario in a fresh
+    process of its own, so the worker count never changes the scores. An LB
+    that keeps class- or module-level state can score differently than in
+    the sequential run, where scenarios share that state.
+    """
+    # No warm-up pass: scores come from simulated ticks, not wall time, and an
+    # extra LB instance could perturb implementations with class-level state.
+    _load_types()
+    jobs = min(len(ALL_SCENARIOS), jobs)
+    if jobs > 1:
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        # max_tasks_per_child needs a non-fork start method
+        with ProcessPoolExecutor(
+            jobs,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(sys.path,),
+            max_tasks_per_child=1,
+        ) as pool:
+            results = list(pool.map(
+                run_scenario, ALL_SCENARIOS, itertools.repeat(lb_class), itertools.repeat(seed),
+            ))
+    else:
+        results = [run_scenario(scenario_fn, lb_class, seed) for scenario_fn in ALL_SCENARIOS]
 
     # Weighted aggregate
     total_weight = sum(r.weight for r in results)
@@ -759,9 +904,18 @@ def main():
     parser.add_argument("--workspace", required=True, help="Path to workspace containing load_balancer/ module")
     parser.add_argument("--output", required=True, help="Path to write JSON results")
     parser.add_argument("--seed", type=int, default=42, help="Random seed for determinism")
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes to run scenarios in, one fresh process per scenario (default: 1 = sequential)",
+    )
+    parser.add_argument("--pretty", action="store_true", help="Indent the JSON results for reading by hand")
     args = parser.parse_args()
 
     workspace = Path(args.workspace).resolve()
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
 
     # Add workspace to Python path so we can import load_balancer
     sys.path.insert(0, str(workspace))
@@ -776,14 +930,14 @@ def main():
     try:
         mod = importlib.import_module("load_balancer")
         lb_class = getattr(mod, "LoadBalancer")
+        _load_types()
     except Exception as e:
         error_result = {
             "aggregate_score": 0.0,
             "error": f"Failed to import LoadBalancer: {type(e).__name__}: {e}\n{traceback.format_exc()}",
             "scenarios": [],
         }
-        Path(args.output).parent.mkdir(parents=True, exist_ok=True)
-        Path(args.output).write_text(json.dumps(error_result, indent=2))
+        output.write_bytes(dumps_results(error_result, pretty=args.pretty))
         print(f"IMPORT ERROR: {e}", file=sys.stderr)
         sys.exit(1)
 
@@ -791,10 +945,9 @@ def main():
     print(f"LoadBalancer class: {lb_class}")
     print(f"Seed: {args.seed}")
 
-    results = run_all(lb_class, args.seed)
+    results = run_all(lb_class, args.seed, jobs=args.jobs)
 
-    Path(args.output).parent.mkdir(parents=True, exist_ok=True)
-    Path(args.output).write_text(json.dumps(results, indent=2))
+    output.write_bytes(dumps_results(results, pretty=args.pretty))
 
     print(f"\nAggregate score: {results['aggregate_score']}/100")
     for s in results["scenarios"]:
@@ -6,120 +6,261 @@ Aggregates per-condition JSON results from results/benchmarks/{problem}/{conditi
 into a comparison TSV and prints a ranked summary table.
 
 Usage:
-    python3 report.py [--results-dir ../../results/benchmarks] [--output report.tsv]
+    python3 report.py [--results-dir ../../results/benchmarks] [--output report.tsv] [--cache]
 """
 
 from __future__ import annotations
 
 import argparse
+import contextlib
 import json
+import mmap
+import os
+import pickle
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 from pathlib import Path
 
+try:
+    from orjson import loads as json_loads
 
-def load_results(results_dir: Path) -> dict[str, dict[str, dict]]:
+    LOADS_BUFFERS = True  # orjson also parses memoryviews, e.g. over an mmap
+except ImportError:
+    from json import loads as json_loads
+
+    LOADS_BUFFERS = False
+
+MMAP_MIN_BYTES = 4096  # smaller files are cheaper to read() than to map
+CACHE_NAME = ".report_cache.pkl"  # written next to the results by --cache
+SCRIPT_DIR = Path(__file__).resolve().parent
+
+
+def read_json(json_file: str):
+    """Parse a JSON file, through a read-only mmap for large files when orjson is available."""
+    with open(json_file, "rb") as f:
+        if LOADS_BUFFERS and os.fstat(f.fileno()).st_size >= MMAP_MIN_BYTES:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                return json_loads(view)
+        return json_loads(f.read())
+
+
+def summarize_result(result: dict) -> dict:
+    """
+    Keep only the fields the report reads from a benchmark result.
+
+    That is aggregate_score, error and each scenario's name/score; per-scenario
+    details and weights are dropped so they are not held for the whole run.
+    """
+    summary = {key: result[key] for key in ("aggregate_score", "error") if key in result}
+    if "scenarios" in result:
+        summary["scenarios"] = [{"name": s["name"], "score": s["score"]} for s in result["scenarios"]]
+    return summary
+
+
+def load_result_file(json_file: str) -> tuple[dict, str | None]:
+    """
+    Read and summarize one result file.
+
+    Returns (result, error); an unreadable file yields a zero-score result
+    carrying the error message, plus the message for the caller to report.
+    Only plain data is returned, so this can run in a worker process.
+    """
+    try:
+        return summarize_result(read_json(json_file)), None
+    except (json.JSONDecodeError, OSError) as e:  # orjson's decode error subclasses json's
+        return {"aggregate_score": 0.0, "error": str(e)}, str(e)
+
+
+def load_cache(cache_path: Path) -> dict[str, tuple[int, dict]]:
+    """Read a summary cache written by save_cache; a missing or unreadable cache is empty."""
+    try:
+        with open(cache_path, "rb") as f:
+            cache = pickle.load(f)
+    except (OSError, EOFError, ValueError, pickle.UnpicklingError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def save_cache(cache_path: Path, cache: dict[str, tuple[int, dict]]) -> None:
+    """Write the summary cache, warning (not failing) if it cannot be written."""
+    try:
+        cache_path.write_bytes(pickle.dumps(cache, protocol=pickle.HIGHEST_PROTOCOL))
+    except OSError as e:
+        print(f"WARNING: Failed to write cache {cache_path}: {e}", file=sys.stderr)
+
+
+def load_results(
+    results_dir: Path, cache: dict[str, tuple[int, dict]] | None = None, jobs: int = 1
+) -> dict[str, dict[str, dict]]:
     """
     Load all benchmark results.
 
+    Files are read and parsed on a thread pool in this process, or across up
+    to jobs worker processes if jobs > 1; results (and warnings) are still
+    assembled in sorted problem/condition order.
+
+    If cache is given ({path: (mtime_ns, summarized_result_dict)}), files
+    whose mtime is unchanged are taken from it instead of being parsed, and
+    it is updated in place to hold exactly the files that loaded cleanly.
+
     Returns:
-        {problem: {condition: result_dict}}
+        {problem: {condition: summarized_result_dict}}
     """
     data: dict[str, dict[str, dict]] = {}
+    json_files: list[tuple[str, str, str, int | None]] = []  # (problem, condition, path, mtime_ns)
+    fresh: dict[str, tuple[int, dict]] = {}
+
+    # DirEntry caches name and type from the directory read, so listing costs
+    # no per-entry stat beyond what is_dir() needs
+    with os.scandir(results_dir) as it:
+        problem_entries = sorted((e for e in it if e.is_dir()), key=lambda e: e.name)
+
+    for problem_entry in problem_entries:
+        problem = problem_entry.name
+        conditions = data[problem] = {}
+        with os.scandir(problem_entry.path) as it:
+            json_entries = sorted((e for e in it if e.name.endswith(".json")), key=lambda e: e.name)
+        for e in json_entries:
+            condition = e.name[: -len(".json")]
+            # Claim the slot now so conditions stay in sorted order whichever way they load
+            conditions[condition] = None
+            mtime_ns = None
+            if cache is not None:
+                try:
+                    mtime_ns = e.stat().st_mtime_ns
+                except OSError:
+                    pass
+                cached = cache.get(e.path)
+                if cached is not None and cached[0] == mtime_ns:
+                    conditions[condition] = cached[1]
+                    fresh[e.path] = cached
+                    continue
+            json_files.append((problem, condition, e.path, mtime_ns))
+
+    paths = [path for _, _, path, _ in json_files]
+    workers = min(len(paths), jobs)
+    if workers > 1:
+        # Parsing holds the GIL, but process startup outweighs it for a few
+        # small files, so processes are only used when asked for
+        from concurrent.futures import ProcessPoolExecutor
+
+        executor = ProcessPoolExecutor(max_workers=workers)
+        chunksize = max(1, len(paths) // (workers * 4))
+    else:
+        executor = ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4))
+        chunksize = 1
+    with executor as pool:
+        loaded = pool.map(load_result_file, paths, chunksize=chunksize)
+        for (problem, condition, path, mtime_ns), (result, error) in zip(json_files, loaded):
+            if error is not None:
+                print(f"WARNING: Failed to read {path}: {error}", file=sys.stderr)
+            elif mtime_ns is not None:
+                fresh[path] = (mtime_ns, result)
+            data[problem][condition] = result
+
+    if cache is not None:
+        cache.clear()
+        cache.update(fresh)
+    return data
 
-    for problem_dir in sorted(results_dir.iterdir()):
-        if not problem_dir.is_dir():
-            continue
-        problem = problem_dir.name
-        data[problem] = {}
-
-        for json_file in sorted(problem_dir.glob("*.json")):
-            condition = json_file.stem
-            try:
-                result = json.loads(json_file.read_text())
-                data[problem][condition] = result
-            except (json.JSONDecodeError, OSError) as e:
-                print(f"WARNING: Failed to read {json_file}: {e}", file=sys.stderr)
-                data[problem][condition] = {"aggregate_score": 0.0, "error": str(e)}
 
-    return data
+MEDALS = {1: " 🥇", 2: " 🥈", 3: " 🥉"}
 
+# Flat per-problem record, built once by rank_conditions and shared by the
+# table and the TSV: (condition, aggregate_score, error, ((scenario_name, score), ...))
+Row = tuple[str, float, str, tuple[tuple[str, float], ...]]
 
-def print_comparison_table(data: dict[str, dict[str, dict]]) -> None:
-    """Print a formatted comparison table to stdout."""
-    for problem, conditions in data.items():
-        if not conditions:
-            continue
 
-        print(f"\n{'=' * 70}")
-        print(f"  Problem: {problem}")
-        print(f"{'=' * 70}")
+def rank_conditions(conditions: dict[str, dict]) -> list[Row]:
+    """Flatten one problem's results into rows, sorted by aggregate score descending."""
+    rows = [
+        (
+            condition,
+            result.get("aggregate_score", 0.0),
+            result.get("error", ""),
+            tuple((s["name"], s["score"]) for s in result.get("scenarios", [])),
+        )
+        for condition, result in conditions.items()
+    ]
+    # One stable sort keyed by a C itemgetter serves both the table and the TSV;
+    # condition counts are far too small for an array-based argsort to pay off
+    rows.sort(key=itemgetter(1), reverse=True)
+    return rows
 
-        # Sort by aggregate score descending
-        ranked = sorted(conditions.items(), key=lambda x: x[1].get("aggregate_score", 0), reverse=True)
 
-        # Header
-        print(f"\n  {'Rank':<6}{'Condition':<16}{'Score':>8}  Scenario Breakdown")
-        print(f"  {'─' * 60}")
+def _print_problem_table(problem: str, rows: list[Row]) -> None:
+    print(f"\n{'=' * 70}")
+    print(f"  Problem: {problem}")
+    print(f"{'=' * 70}")
 
-        for rank, (condition, result) in enumerate(ranked, 1):
-            score = result.get("aggregate_score", 0.0)
-            error = result.get("error", "")
+    # Header
+    print(f"\n  {'Rank':<6}{'Condition':<16}{'Score':>8}  Scenario Breakdown")
+    print(f"  {'─' * 60}")
 
-            if error and not result.get("scenarios"):
-                print(f"  {rank:<6}{condition:<16}{score:>7.1f}  IMPORT ERROR")
-                continue
+    for rank, (condition, score, error, scenarios) in enumerate(rows, 1):
+        if error and not scenarios:
+            print(f"  {rank:<6}{condition:<16}{score:>7.1f}  IMPORT ERROR")
+            continue
 
-            # Scenario breakdown
-            scenarios = result.get("scenarios", [])
-            breakdown = "  ".join(
-                f"{s['name'][:4]}={s['score']:.2f}" for s in scenarios
-            )
+        # Scenario breakdown
+        breakdown = "  ".join(f"{name[:4]}={s_score:.2f}" for name, s_score in scenarios)
 
-            # Medal for top 3
-            medal = {1: " 🥇", 2: " 🥈", 3: " 🥉"}.get(rank, "")
-            print(f"  {rank:<6}{condition:<16}{score:>7.1f}  {breakdown}{medal}")
+        # Medal for top 3
+        medal = MEDALS.get(rank, "")
+        print(f"  {rank:<6}{condition:<16}{score:>7.1f}  {breakdown}{medal}")
 
-        print()
+    print()
 
 
-def write_tsv(data: dict[str, dict[str, dict]], output_path: Path) -> None:
-    """Write a TSV file with all results for further analysis."""
-    # Collect all scenario names from first result
-    scenario_names: list[str] = []
-    for conditions in data.values():
-        for result in conditions.values():
-            for s in result.get("scenarios", []):
-                if s["name"] not in scenario_names:
-                    scenario_names.append(s["name"])
-            if scenario_names:
-                break
-        if scenario_names:
-            break
+def render(data: dict[str, dict[str, dict]], tsv_path: Path | None = None, *, show_table: bool = True) -> None:
+    """
+    Print the comparison table and/or write the TSV in one pass over data.
+
+    Each problem's conditions are ranked once and the rows feed both outputs;
+    TSV rows (if tsv_path is given) are written as each problem is ranked.
+    """
+    # TSV columns follow the scenario order of the first result that has any
+    first_scenarios = next(
+        (result["scenarios"] for conditions in data.values() for result in conditions.values() if result.get("scenarios")),
+        [],
+    )
+    scenario_names = list(dict.fromkeys(s["name"] for s in first_scenarios))
 
     headers = ["problem", "condition", "aggregate_score", "rank"] + [f"s_{name}" for name in scenario_names]
 
-    lines = ["\t".join(headers)]
+    # One %-template per column layout formats a whole row in a single call
+    row_format = "\t".join(["%s", "%s", "%.2f", "%d"] + ["%.4f"] * len(scenario_names)) + "\n"
 
-    for problem, conditions in data.items():
-        ranked = sorted(conditions.items(), key=lambda x: x[1].get("aggregate_score", 0), reverse=True)
+    # Rows are streamed to the file as they are produced; nothing is formatted without a TSV
+    with tsv_path.open("wb", buffering=1 << 20) if tsv_path is not None else contextlib.nullcontext() as tsv:
+        if tsv is not None:
+            tsv.write(("\t".join(headers) + "\n").encode())
 
-        for rank, (condition, result) in enumerate(ranked, 1):
-            score = result.get("aggregate_score", 0.0)
-            scenario_scores = {s["name"]: s["score"] for s in result.get("scenarios", [])}
+        for problem, conditions in data.items():
+            rows = rank_conditions(conditions)
+            if show_table and rows:
+                _print_problem_table(problem, rows)
+            if tsv is None:
+                continue
 
-            row = [
-                problem,
-                condition,
-                f"{score:.2f}",
-                str(rank),
-            ]
-            for sname in scenario_names:
-                row.append(f"{scenario_scores.get(sname, 0.0):.4f}")
+            for rank, (condition, score, _, scenarios) in enumerate(rows, 1):
+                scenario_scores = dict(scenarios)
+                values = (problem, condition, score, rank, *[scenario_scores.get(sname, 0.0) for sname in scenario_names])
+                tsv.write((row_format % values).encode())
 
-            lines.append("\t".join(row))
+    if tsv_path is not None:
+        print(f"\nTSV written to: {tsv_path}")
 
-    output_path.write_text("\n".join(lines) + "\n")
-    print(f"\nTSV written to: {output_path}")
+
+def print_comparison_table(data: dict[str, dict[str, dict]]) -> None:
+    """Print a formatted comparison table to stdout."""
+    render(data)
+
+
+def write_tsv(data: dict[str, dict[str, dict]], output_path: Path) -> None:
+    """Write a TSV file with all results for further analysis."""
+    render(data, output_path, show_table=False)
 
 
 def main() -> None:
@@ -130,6 +271,18 @@ def main() -> None:
         help="Path to benchmarks results directory (default: auto-detect)",
     )
     parser.add_argument("--output", default=None, help="Path to write TSV output")
+    parser.add_argument(
+        "--cache",
+        action=argparse.BooleanOptionalAction,
+        default=False,
+        help=f"Reuse summaries of unchanged result files from {CACHE_NAME} in the results directory",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes to parse result files in (default: 1 = this process)",
+    )
     args = parser.parse_args()
 
     # Auto-detect results directory
@@ -137,28 +290,32 @@ def main() -> None:
         results_dir = Path(args.results_dir).resolve()
     else:
         # Try relative to script location
-        results_dir = Path(__file__).resolve().parent.parent.parent / "results" / "benchmarks"
+        results_dir = SCRIPT_DIR.parent.parent / "results" / "benchmarks"
 
     if not results_dir.exists():
         print(f"ERROR: Results directory not found: {results_dir}", file=sys.stderr)
         print("Run benchmarks first with ./tests/benchmarks/run_benchmarks.sh", file=sys.stderr)
         sys.exit(1)
 
-    data = load_results(results_dir)
+    if args.cache:
+        cache_path = results_dir / CACHE_NAME
+        cache = load_cache(cache_path)
+        data = load_results(results_dir, cache, jobs=args.jobs)
+        save_cache(cache_path, cache)
+    else:
+        data = load_results(results_dir, jobs=args.jobs)
 
     if not data:
         print("No benchmark results found.", file=sys.stderr)
         sys.exit(1)
 
-    print_comparison_table(data)
-
-    # Write TSV
+    # Print the table and write the TSV
     if args.output:
         output_path = Path(args.output).resolve()
     else:
         output_path = results_dir / "report.tsv"
 
-    write_tsv(data, output_path)
+    render(data, output_path)
 
 
 if __name__ == "__main__":